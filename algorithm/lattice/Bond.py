@@ -2,7 +2,19 @@ from dataclasses import dataclass, field
 from typing import Dict, Tuple, Optional
 
 
-@dataclass
+# Bond types as stored in Lattice.bond_types, indexed by code (0 = untyped)
+bond_type_names = (None, "structural", "complementary", "cutoff_ratio_change")
+bond_type_codes = {type: code for code, type in enumerate(bond_type_names)}
+
+def bond_type_code(type: Optional[str]) -> int:
+    """Get the Lattice.bond_types code of a bond type (one of bond_type_names)."""
+    try:
+        return bond_type_codes[type]
+    except KeyError:
+        raise ValueError(f"Unknown bond type: {type!r}, expected one of {bond_type_names}") from None
+
+
+@dataclass(slots=True)
 class Bond:
     """
     The 'Bond' dataclass represents a bond attached to a particular 
@@ -21,24 +33,40 @@ class Bond:
     type: Optional[str] = None
     bond_partner: Optional['Bond'] = None
 
+    # Slot in the owning Lattice's bond_colors / bond_types arrays (row views + column), 
+    # bound by the Lattice
+    _color_row: Optional['np.ndarray'] = field(default=None, init=False, repr=False, compare=False)
+    _type_row: Optional['np.ndarray'] = field(default=None, init=False, repr=False, compare=False)
+    _slot_index: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
     # Setting methods
     def set_color(self, color: int):
-        """Set the color of the bond."""
+        """Set the color of the bond (mirrored into the Lattice's bond_colors, 0 = uncolored)."""
         self.color = color
+        if self._color_row is not None:
+            self._color_row[self._slot_index] = 0 if color is None else color
 
     def set_bond_partner(self, bond_partner: 'Bond'):
         """Set the Bond object which this bond is connected to."""
         self.bond_partner = bond_partner
 
     def set_type(self, type: str = None):
-        """Set bond type to be either a 'structural' or 'mapped' bond."""
+        """Set bond type to one of bond_type_names, eg. 'structural' (mirrored into the Lattice's bond_types)."""
+        code = bond_type_code(type) # Raises on an unknown type before anything is written
         self.type = type
+        if self._type_row is not None:
+            self._type_row[self._slot_index] = code
+
+    def paint(self, color: int, type: str):
+        """Set the color and type of the bond at once (same as set_color + set_type)."""
+        bond_type_code(type) # Validate the type first, so a bad type leaves the bond untouched
+        self.set_color(color)
+        self.set_type(type)
 
     # Getting methods
     def get_label(self) -> str:
         """Get a string label for the bond."""
-        direction_index = self.voxel.vertex_directions.index(self.direction)
-        return self.voxel.vertex_names[direction_index]
+        return self.voxel.direction_labels[self.direction]
     
     def get_partner_voxel(self) -> 'Voxel':
         """Get the Voxel object that this bond is connected to."""
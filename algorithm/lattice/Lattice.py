@@ -13,7 +13,7 @@ import numpy as np
 import pandas as pd
 
 from algorithm.lattice.Voxel import Voxel
-from algorithm.lattice.Bond import Bond
+from algorithm.lattice.Bond import Bond, bond_type_names
 from algorithm.symmetry.Relation import Relation
 
 class Lattice:
@@ -27,17 +27,24 @@ class Lattice:
             - Coordinate system based on Voxel location in MinDesign
         voxel_list: List of Voxel objects
         coord_list: List of each Voxel's coordinates in euclidean space
+        coord_arr: (N, 3) contiguous np.array(int32) of the same coordinates, for vectorized code
+        coord_to_index: Dictionary mapping each Voxel's coordinates to its index
+        voxel_grid: 3D np.array(Voxel) shaped like MinDesign, indexed by Voxel.np_index
+        partner_table: (N, 6) np.array(ints), id of each voxel's neighbor in each vertex direction
+            (the partner bond sits in the opposite direction, column d^1)
+        bond_colors: (N, 6) np.array(ints), bond colors of each voxel in vertex_directions
+            order (0 = uncolored), kept in sync by Bond.set_color
+        bond_types: (N, 6) np.array(uint8), codes of the same bonds' types (see Bond.bond_type_names,
+            0 = untyped), kept in sync by Bond.set_type
 
     Methods:
         get_voxel: Get a Voxel object by its index or coordinates
         get_partner: Get the bond partner of a voxel in a given direction
         _is_unit_cell: Returns whether a given lattice is a unit cell
-        _init_voxels: Initializes all Voxel + blank Bond objects and their coordinates
-                        in the Lattice.MinDesign
-        _fill_partners: Fills all bond partners on all voxels in voxel_list in place
-        _get_partner: Internal method to get the bond partner of a voxel (for _fill_partners)
+        _build_lattice: Initializes all Voxel + Bond objects and their coordinates
+                        in the Lattice.MinDesign, filling all bond partners in the same pass
+        _get_partner: Internal method to get the bond partner of a single voxel
     """
-    
     def __init__(self, input_lattice: np.array):
         """
         Initialize the objects and data structures needed for the coloring algorithm.
@@ -47,6 +54,9 @@ class Lattice:
         Parameters:
             - input_lattice:  3D np.array of ints (direct output from GUI)
         """
+        # Store material ids compactly (int8) when they fit
+        input_lattice = Lattice._compact_materials(input_lattice)
+
         # Was user's design already a unit cell?
         is_unit_cell = Lattice._is_unit_cell(input_lattice)
 
@@ -57,17 +67,32 @@ class Lattice:
             self.UnitCell = np.pad(input_lattice, ((0, 1), (0, 1), (0, 1)), 'wrap') # Repeat layers
             self.MinDesign = input_lattice
 
-        self.voxels, self.coord_list = self._init_voxels(self.MinDesign)
-        self._fill_partners()
+        z_max, y_max, x_max = self.MinDesign.shape
+        self._xyz_bounds = (x_max, y_max, z_max) # Euclidean (x, y, z) extent of MinDesign
+        self._build_lattice(self.MinDesign)
+
+        # Structure-of-arrays copies of per-voxel data (row i <-> voxel i),
+        # read by the aggregate methods instead of walking the Voxel objects
+        self._materials = np.array(self.MinDesign).ravel()
+        self.bond_colors = np.zeros((len(self.voxels), len(Voxel.vertex_directions)),
+                                    dtype=Lattice._bond_color_dtype(len(self.voxels)))
+        self.bond_types = np.zeros((len(self.voxels), len(Voxel.vertex_directions)), dtype=np.uint8)
+        self._bind_bond_arrays()
 
         # Algorithm data structures
         # self.rotater = Rotater()
         self.Surroundings = None
         self.symmetry_df = None
         self.colordict = None
+        self._color_components = None # {color: voxel id components}, reset with colordict
         self.default_color_config = {}
         self.n_colors = 0
 
+    def __setstate__(self, state):
+        """Rebind the bonds' bond_colors / bond_types slots after unpickling / deepcopy."""
+        self.__dict__.update(state)
+        self._bind_bond_arrays()
+
     # --- Public methods ---
     def compute_symmetries(self):
         """
@@ -91,15 +116,12 @@ class Lattice:
         @return:
             - voxel: The desired Voxel object
         """
-        if isinstance(id, int):
+        if isinstance(id, (int, np.integer)):
             # Case 1: id is an index (int)
             voxel_index = id
-        elif isinstance(id, tuple):
-            # Case 2: id is euclidean coordinates (tuple)
-            voxel_index = self.coord_list.index(id)
-        elif isinstance(id, np.ndarray):
-            # Case 3: id is np.ndarray coordinates
-            voxel_index = self.coord_list.index(tuple(id))
+        elif isinstance(id, (tuple, np.ndarray)):
+            # Case 2/3: id is euclidean coordinates (tuple or np.ndarray)
+            return self._voxel_at(id)
         else:
             # Case 4: Invalid type
             raise ValueError(f"Invalid id type: {type(id)}")
@@ -111,23 +133,25 @@ class Lattice:
         """
         Returns the final dataframe of the lattice.
         """
-        # Lists to store combined voxel and bond information
-        final_df = []
+        bond_labels = Voxel.vertex_names
+
+        # One list per column (colors read from bond_colors, 0 -> None for uncolored)
+        ids = list(range(len(self.voxels)))
+        materials = self._materials.tolist()
+        coordinates = self.coord_list
+        if show_bond_type:
+            type_names = np.array(bond_type_names, dtype=object)
+            bond_columns = type_names[self.bond_types.T].tolist()
+        else:
+            bond_columns = [[color or None for color in column] for column in self.bond_colors.T.tolist()]
 
-        # Iterate through the voxels and bonds
-        for voxel in self.voxels:
-            row = {
-                ('Voxel', 'ID'): voxel.id,
-                ('Voxel', 'Material'): voxel.material,
-                ('Voxel', 'Coordinates'): voxel.coordinates
-            }
-            for _, bond in voxel.bond_dict.dict.items():
-                bond_label = bond.type if show_bond_type else bond.color
-                row[('Bond Colors', bond.get_label())] = bond_label
-            final_df.append(row)
-
-        # Create a DataFrame from the combined list
-        final_df = pd.DataFrame(final_df)
+        # Create a DataFrame from the columns
+        final_df = pd.DataFrame({
+            ('Voxel', 'ID'): ids,
+            ('Voxel', 'Material'): materials,
+            ('Voxel', 'Coordinates'): coordinates,
+            **{('Bond Colors', label): column for label, column in zip(bond_labels, bond_columns)}
+        })
 
         # Convert the voxels / bonds into nested columns format
         final_df.columns = pd.MultiIndex.from_tuples(final_df.columns)
@@ -139,25 +163,73 @@ class Lattice:
         """
         Returns a list of unique origami (Voxel+Bonds) in the lattice.
         """
+        return [voxel.id for voxel in self._unique_origami_voxels()]
+
+    def unique_origami_count(self) -> int:
+        """
+        Returns the number of unique origami (Voxel+Bonds) in the lattice.
+        """
+        return len(self._unique_origami_voxels())
+
+
+    # --- Internal methods ---
+    def _unique_origami_voxels(self) -> list[Voxel]:
+        """
+        Internal method to find one representative Voxel object for each unique origami.
+        Keeps the Voxel objects themselves so comparisons don't need get_voxel lookups.
+        """
         if self.symmetry_df is None:
             raise ValueError("SymmetryDf not computed yet. Run Lattice.compute_symmetries() first.")
         
-        unique_origami = [self.voxels[0].id]  # Initialize with the first voxel's ID in lattice
-
-        for voxel1 in self.voxels:
-            if all(         # If for all voxel2's in unique_origami
+        unique_voxels = []
+        # Unique voxels bucketed by their _origami_signatures, so each voxel is
+        # only checked against candidates that could possibly be "equal" to it
+        signature_buckets = {}
+        partial_buckets = {}    # material -> unique voxels with uncolored bonds
+        material_buckets = {}   # material -> all unique voxels
+
+        def add_unique(voxel, signature):
+            unique_voxels.append(voxel)
+            if signature is None:
+                partial_buckets.setdefault(voxel.material, []).append(voxel)
+            else:
+                signature_buckets.setdefault(signature, []).append(voxel)
+            material_buckets.setdefault(voxel.material, []).append(voxel)
+
+        signatures = self._origami_signatures()
+        add_unique(self.voxels[0], signatures[0])  # Initialize with the first voxel in lattice
+
+        for voxel1, signature in zip(self.voxels, signatures):
+            if signature is None:
+                candidates = material_buckets.get(voxel1.material, [])
+            else:
+                candidates = signature_buckets.get(signature, []) + partial_buckets.get(voxel1.material, [])
+
+            if all(         # If for all candidate voxel2's in unique_voxels
                 not any(    # voxel1 and voxel2 don't satisfy "equal" relation
-                    Relation.get_voxel_relation(voxel1, self.get_voxel(voxel2_id), sym_label) == "equal"
-                    for sym_label in self.symmetry_df.symlist(voxel1.id, voxel2_id) or [] 
+                    Relation.get_voxel_relation(voxel1, voxel2, sym_label) == "equal"
+                    for sym_label in self.symmetry_df.symlist(voxel1.id, voxel2.id) or [] 
                 ) # ^^ for any given rotation under which they could be equal
-                for voxel2_id in unique_origami
+                for voxel2 in candidates
             ):
-                unique_origami.append(voxel1.id) # then voxel1 is unique
+                add_unique(voxel1, signature) # then voxel1 is unique
 
-        return unique_origami
+        return unique_voxels
 
+    def _origami_signatures(self) -> list:
+        """
+        Rotation-invariant signature of each fully colored voxel: its material and
+        the sorted multiset of its bond colors. Two voxels can only be "equal"
+        under some rotation if their signatures match. None for voxels with
+        uncolored bonds, since uncolored bonds compare "loose" against anything.
+        """
+        sorted_colors = np.sort(self.bond_colors, axis=1)
+        is_colored = (self.bond_colors != 0).all(axis=1).tolist()
+        return [
+            (material, colors.tobytes()) if colored else None
+            for material, colors, colored in zip(self._materials.tolist(), sorted_colors, is_colored)
+        ]
 
-    # --- Internal methods ---
     def _is_unit_cell(lattice: np.ndarray) -> bool:
         """
         Returns whether a given lattice (np.array) is a unit cell.
@@ -169,46 +241,94 @@ class Lattice:
             is_unit_cell (bool): True if unit_cell, False otherwise
         """
         z_len, y_len, x_len = lattice.shape
-        x_repeat, y_repeat, z_repeat = False, False, False
-        is_unit_cell = False
-        
-        # Check if z, y, or x layers are repeated
-        if np.array_equal(lattice[0, :, :], lattice[-1, :, :]) and z_len > 2:
-            z_repeat = True
-        if np.array_equal(lattice[:, 0, :], lattice[:, -1, :]) and x_len > 2:
-            y_repeat = True
-        if np.array_equal(lattice[:, :, 0], lattice[:, :, -1]) and y_len > 2: 
-            x_repeat = True
+
+        # Check if z, y, and x layers are repeated. Each check compares the two
+        # layer views elementwise into one shared scratch buffer (no copies), 
+        # and we stop at the first mismatch
+        scratch = np.empty(max(y_len * x_len, z_len * x_len, z_len * y_len), dtype=bool)
+        is_unit_cell = (
+            (z_len > 2 and Lattice._layers_equal(lattice[0, :, :], lattice[-1, :, :], scratch)) and
+            (x_len > 2 and Lattice._layers_equal(lattice[:, 0, :], lattice[:, -1, :], scratch)) and
+            (y_len > 2 and Lattice._layers_equal(lattice[:, :, 0], lattice[:, :, -1], scratch))
+        )
         
         # If all layers are repeated (and have > 2 dimlength), the lattice is a unit cell
-        if x_repeat and y_repeat and z_repeat:
-            is_unit_cell = True
-        
-        return is_unit_cell
+        return bool(is_unit_cell)
+
+    @staticmethod
+    def _compact_materials(lattice: np.ndarray) -> np.ndarray:
+        """
+        Returns the lattice as a contiguous int8 array if all material ids are
+        integers in the int8 range (including whole-valued floats, eg. 1.0 -> 1), 
+        else returns the lattice unchanged.
+        """
+        lattice = np.asarray(lattice)
+        if np.issubdtype(lattice.dtype, np.floating):
+            if not np.array_equal(lattice, np.round(lattice)):
+                return lattice
+        elif not np.issubdtype(lattice.dtype, np.integer):
+            return lattice # Non-numeric (or bool) designs are left as they are
+
+        int8_info = np.iinfo(np.int8)
+        if lattice.size and (lattice.min() < int8_info.min or lattice.max() > int8_info.max):
+            return lattice
+        return np.ascontiguousarray(lattice, dtype=np.int8)
+
+    @staticmethod
+    def _bond_color_dtype(n_voxels: int) -> np.dtype:
+        """
+        Smallest signed int dtype for the bond colors of a lattice with n_voxels.
+        Painting uses at most one new color per bond (6 per voxel), and repainting
+        (eg. binding flexibility) at most one more per bond, so colors stay within 
+        +-12 * n_voxels.
+        """
+        return np.promote_types(np.int8, np.min_scalar_type(-12 * max(n_voxels, 1)))
+
+    @staticmethod
+    def _layers_equal(layer1: np.ndarray, layer2: np.ndarray, scratch: np.ndarray) -> bool:
+        """
+        Returns whether two (same shape) layers of a lattice are identical,
+        comparing into the front of a flat boolean scratch buffer.
+        """
+        out = scratch[:layer1.size].reshape(layer1.shape)
+        return bool(np.equal(layer1, layer2, out=out).all())
     
 
-    def _init_voxels(self, MinDesign: np.array) -> tuple[list[Voxel], list[tuple]]:
+    def _build_lattice(self, MinDesign: np.array) -> None:
         """
-        Create Voxel objects for each voxel in MinDesign, filling the following lists:
-            - voxel_list: List of Voxel objects
+        Create Voxel objects for each voxel in MinDesign and fill their bond partners
+        in a single pass, setting the following in place:
+            - voxels: List of Voxel objects
             - coord_list: List of coordinates of each voxel
+            - coord_arr: (N, 3) int32 array of the same coordinates
+            - coord_to_index: Dictionary mapping each Voxel's coordinates to its index
+            - voxel_grid: 3D array of the Voxel objects, indexed like MinDesign
+            - partner_table: (N, 6) array of each voxel's neighbor ids, in vertex_directions order
         where Voxel.index for each voxel can quickly index and retrieve the 
         Voxel object / coordinates from the corresponding list.
+        Each voxel's bonds are connected as soon as the voxel is created, to itself 
+        and all previously created neighbors. Bonds to neighbors created later 
+        are connected when that neighbor is created.
         @param:
             - MinDesign: 3D numpy array of ints, the minimum copy-pastable design
-        @return:
-            - voxel_list: List of Voxel objects
-            - coord_list: List of tuples of ints
         """
         voxel_list = []
-        coord_list = []
-
-        id = 0
-        # 1. Initialize all voxels with empty vertices
-        for np_index, material in np.ndenumerate(MinDesign):
-            # Map voxel's numpy index into euclidean space
-            coordinates = CoordinateManager.npindex_to_euclidean(np_index, MinDesign.shape)
-            
+
+        # Map every voxel's numpy index into euclidean space at once
+        z_max, y_max, x_max = MinDesign.shape
+        zi, yi, xi = np.indices(MinDesign.shape).reshape(3, -1)
+        np_indices = zip(zi.tolist(), yi.tolist(), xi.tolist())
+        coord_arr = CoordinateManager.all_euclidean(MinDesign.shape).reshape(-1, 3)
+        coord_list = [tuple(coordinates) for coordinates in coord_arr.tolist()]
+        coord_to_index = {coords: index for index, coords in enumerate(coord_list)}
+
+        # Ids of every (voxel, direction) neighbor
+        partner_table = _partner_ids(coord_arr, x_max, y_max, z_max)
+        partner_ids = partner_table.tolist()
+
+        directions = Voxel.vertex_directions
+        for id, (material, coordinates, np_index, voxel_partner_ids) in enumerate(
+                zip(MinDesign.ravel(), coord_list, np_indices, partner_ids)):
             # Create new Voxel object with given info
             current_voxel = Voxel(
                 id=id, 
@@ -216,45 +336,64 @@ class Lattice:
                 coordinates=coordinates, 
                 np_index=np_index
             )
-            
-            # Append current voxel and its coordinates to the lists
             voxel_list.append(current_voxel)
-            coord_list.append(coordinates)
-            id += 1
-
-        # Print all voxel indices and coordinates
-        # ids = ', '.join(str(voxel.id) for voxel in voxel_list)
-        # print(f'Initialized Voxels: {ids}')
-        # coords = ', '.join(str(coord) for coord in coord_list)
-        # print(f'With coordinates: {coords}')
-
-        # for voxel in voxel_list:
-        #     print(f"init voxel_{voxel.id} ({voxel.material}): coords {voxel.coordinates}")
 
-        return voxel_list, coord_list
-    
-    def _fill_partners(self):
-        """Fill all bond partners on all voxels in voxel_list in place."""
-        for voxel in self.voxels:
-            for direction in voxel.vertex_directions:
-                voxel_bond = voxel.get_bond(direction)
+            for direction_index, partner_id in enumerate(voxel_partner_ids):
+                # Partner not created yet: connected once it is
+                if partner_id > id:
+                    continue
+                voxel_bond = current_voxel.bond_dict.dict[directions[direction_index]]
                 # Skip if bond already has a partner
                 if voxel_bond.bond_partner is not None:
                     continue
-                # Get the partner bond the voxel is connected to
-                partner_voxel, partner_bond = self._get_partner(voxel=voxel, 
-                                                                direction=direction)
+                # Partner bond sits on the opposite vertex of the neighboring voxel
+                partner_bond = voxel_list[partner_id].bond_dict.dict[directions[direction_index ^ 1]]
+
                 # Set the partner_bond attributes on both voxels
                 voxel_bond.set_bond_partner(partner_bond)
                 partner_bond.set_bond_partner(voxel_bond)
 
-                # print(f"Filled partner: Voxel {voxel.id} [{voxel.material}] ---{direction}---> Voxel {partner_voxel.id} [{partner_voxel.material}]")
+        self.voxels = voxel_list
+        self.coord_list = coord_list
+        self.coord_arr = coord_arr
+        self.coord_to_index = coord_to_index
+        self.partner_table = partner_table
+        self.voxel_grid = np.empty(len(voxel_list), dtype=object)
+        self.voxel_grid[:] = voxel_list
+        self.voxel_grid = self.voxel_grid.reshape(MinDesign.shape)
+    
+    def _bind_bond_arrays(self):
+        """Point every bond's color / type slots at its row/column of self.bond_colors / self.bond_types."""
+        for voxel in self.voxels:
+            color_row = self.bond_colors[voxel.id]
+            type_row = self.bond_types[voxel.id]
+            for direction_index, direction in enumerate(Voxel.vertex_directions):
+                bond = voxel.bond_dict.dict[direction]
+                bond._color_row = color_row
+                bond._type_row = type_row
+                bond._slot_index = direction_index
+                bond.set_color(bond.color)
+                bond.set_type(bond.type)
     
+    def _voxel_at(self, coordinates) -> Voxel:
+        """
+        Get the Voxel at euclidean coordinates (x, y, z) by indexing voxel_grid
+        directly (see CoordinateManager.npindex_to_euclidean for the mapping).
+        Raises ValueError if no voxel has those coordinates, as coord_list.index would.
+        """
+        x_max, y_max, z_max = self._xyz_bounds
+        if len(coordinates) == 3 and all(isinstance(coordinate, (int, float, np.integer, np.floating))
+                                         and coordinate % 1 == 0 for coordinate in coordinates):
+            x, y, z = (int(coordinate) for coordinate in coordinates)
+            if 0 <= x < x_max and 0 <= y < y_max and 0 <= z < z_max:
+                return self.voxel_grid[z_max - 1 - z, y_max - 1 - y, x]
+        raise ValueError(f"No voxel at coordinates {tuple(coordinates)}")
+
     def _get_partner(self, voxel, direction) -> tuple[Voxel, Bond]:
         """
         Get the bond partner of a voxel in a given direction.
-        Note that directions are all stored as tuples but need to be converted
-        to numpy arrays for element-wise addition.
+        Note that directions are all stored as tuples; np.ndarray directions
+        are converted to tuples first.
         @param:
             - voxel: Voxel object, or the id / coordinates of the desired Voxel
             - direction: Tuple/np.ndarray of 3 values, the euclidean (x,y,z) direction 
@@ -268,33 +407,51 @@ class Lattice:
 
         if isinstance(direction, np.ndarray):
             direction = tuple(direction)
-        
-        partner_coords = np.array(voxel.coordinates) + np.array(direction)
-
-        # For each dimension, if out of bounds, wrap around to find MinDesign coord
-        for dim_index, coords in enumerate(partner_coords):
-            # Define bounds for each dimension
-            LOWER_BOUND = 0
-            z_max, y_max, x_max = self.MinDesign.shape
-            xyz_dimensions = [x_max, y_max, z_max]
-            UPPER_BOUND = xyz_dimensions[dim_index]
-
-            # Wrap around to find coordinate if out of bounds
-            if coords < LOWER_BOUND:
-                partner_coords[dim_index] = UPPER_BOUND + coords
-            elif coords >= UPPER_BOUND:
-                partner_coords[dim_index] = coords - UPPER_BOUND
 
         # Get the partner_voxel + vertex the voxel is connected to
-        partner_voxel = self.get_voxel(partner_coords)
+        # (neighbor ids are precomputed in partner_table)
+        direction_index = Voxel.direction_indices[direction]
+        partner_voxel = self.voxels[self.partner_table[voxel.id, direction_index]]
 
-        partner_vertex_direction = tuple(-np.array(direction)) # Reverse direction to find partner vertex (wrt. partner_voxel)
-        partner_bond = partner_voxel.get_bond(partner_vertex_direction)
+        # Reverse direction to find partner vertex (wrt. partner_voxel); opposite
+        # directions are adjacent pairs in vertex_directions, so flip the low bit
+        partner_vertex_direction = Voxel.vertex_directions[direction_index ^ 1]
+        partner_bond = partner_voxel.bond_dict.dict[partner_vertex_direction]
 
         # Return the bond partner
         return partner_voxel, partner_bond
 
 
+# Vertex directions as an int array, for the vectorized partner kernel
+_DIRECTIONS_ARR = np.array(Voxel.vertex_directions, dtype=np.int32)
+
+
+def _wrap_partners(coords: np.ndarray, x_max: int, y_max: int, z_max: int) -> np.ndarray:
+    """
+    Step every (N, 3) coordinate in each of the 6 vertex directions, 
+    wrapping around the periodic MinDesign bounds.
+    Returns an (N, 6, 3) array ordered like Voxel.vertex_directions.
+    """
+    bounds = np.array([x_max, y_max, z_max], dtype=np.int32)
+    stepped = coords[:, None, :] + _DIRECTIONS_ARR[None, :, :]
+
+    # Power-of-two bounds wrap with a bitmask (also maps -1 -> bound-1)
+    if not np.any(bounds & (bounds - 1)):
+        return stepped & (bounds - 1)
+    return stepped % bounds
+
+
+def _partner_ids(coords: np.ndarray, x_max: int, y_max: int, z_max: int) -> np.ndarray:
+    """
+    Ids of the neighbor of every (N, 3) coordinate in each of the 6 vertex directions,
+    as an (N, 6) array ordered like Voxel.vertex_directions. The wrapped neighbor
+    coordinates are flattened straight to ids (the flat C-order index of their
+    numpy index), without any coordinate lookups.
+    """
+    partner_x, partner_y, partner_z = np.moveaxis(_wrap_partners(coords, x_max, y_max, z_max), -1, 0)
+    return ((z_max - 1 - partner_z) * y_max + (y_max - 1 - partner_y)) * x_max + partner_x
+
+
 class CoordinateManager:
     """
     A utility class to help map a Voxel's numpy array indices to euclidean space.
@@ -331,6 +488,26 @@ class CoordinateManager:
         euclidean_coords = (new_x, new_y, new_z)
         return euclidean_coords
     
+    @staticmethod
+    def all_euclidean(mindesign_shape: tuple) -> np.ndarray:
+        """
+        Vectorized npindex_to_euclidean: transforms every np_index of the MinDesign at once.
+
+        @param:
+            - mindesign_shape: tuple[int, int, int], shape of the MinDesign np.array
+        @return:
+            - coordinates: (z_max, y_max, x_max, 3) np.array(int32), where
+                           coordinates[np_index] is the voxel's (x, y, z)
+        """
+        z_max, y_max, x_max = mindesign_shape
+        new_z, new_y, new_x = np.meshgrid(
+            z_max - 1 - np.arange(z_max, dtype=np.int32),
+            y_max - 1 - np.arange(y_max, dtype=np.int32),
+            np.arange(x_max, dtype=np.int32),
+            indexing='ij'
+        )
+        return np.stack([new_x, new_y, new_z], axis=-1)
+    
     @staticmethod
     def euclidean_to_npindex(coords, shape):
         raise NotImplementedError("no use yet")
\ No newline at end of file
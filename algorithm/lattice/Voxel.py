@@ -13,6 +13,25 @@ class Voxel:
         - get_partner(direction): Returns partner Bond + Voxel objects 
                                   in the supplied direction
     """
+    # ----- Vertex information ----- #
+    # Vertex positions for octahedral structures (shared by all voxels)
+    vertex_names = (
+        "+x", "-x", 
+        "+y", "-y", 
+        "+z", "-z"
+    )
+    # Vector (euclidean) representing direction of each vertex 
+    # wrt. the Voxel @ (0,0,0)
+    vertex_directions = (
+        (1, 0, 0), (-1, 0, 0),   # +-x
+        (0, 1, 0), (0, -1, 0),   # +-y
+        (0, 0, 1), (0, 0, -1)    # +-z
+    )
+    # O(1) lookups between the two (and each direction's position in vertex_directions)
+    direction_labels = dict(zip(vertex_directions, vertex_names))
+    label_directions = dict(zip(vertex_names, vertex_directions))
+    direction_indices = {direction: index for index, direction in enumerate(vertex_directions)}
+
     def __init__(self, id: int, material: int, coordinates: tuple[float, float, float],
                  np_index: tuple[int, int, int], type=None):
         """
@@ -30,21 +49,6 @@ class Voxel:
         self.np_index = np_index
         self.type = type
 
-        # ----- Vertex information ----- #
-        # Vertex positions for octahedral structures
-        self.vertex_names = [
-            "+x", "-x", 
-            "+y", "-y", 
-            "+z", "-z"
-        ]
-        # Vector (euclidean) representing direction of each vertex 
-        # wrt. the Voxel @ (0,0,0)
-        self.vertex_directions = [
-            (1, 0, 0), (-1, 0, 0),   # +-x
-            (0, 1, 0), (0, -1, 0),   # +-y
-            (0, 0, 1), (0, 0, -1)    # +-z
-        ]
-
         # Initialize bonds with default values
         self.bond_dict = BondDict({
             direction: Bond(direction=direction, voxel=self) for direction in self.vertex_directions
@@ -173,7 +177,7 @@ class Voxel:
         """
         for bond in self.bonds.values():
             if abs(bond.color) == color:
-                bond.color = abs(bond.color)*complement
+                bond.set_color(abs(bond.color)*complement)
     
     def flip_complementarity(self, color: int, flipped_voxels=None) -> dict[int, int]:
         """
@@ -269,8 +273,7 @@ class Voxel:
         Get the label of the direction (ex: '+x', '-y', etc.)
         """
         direction = self._get_direction_tuple(direction)
-        direction_index = self.vertex_directions.index(direction)
-        return self.vertex_names[direction_index]
+        return self.direction_labels[direction]
         
     def _get_direction_tuple(self, direction):
         """
@@ -282,8 +285,7 @@ class Voxel:
         """
         if isinstance(direction, str): 
             # Case 1: direction is a str "+x", "-y", ...
-            direction_index = self.vertex_names.index(direction)
-            direction = self.vertex_directions[direction_index]
+            direction = self.label_directions[direction]
 
         elif isinstance(direction, np.ndarray): 
             # Case 2: direction is a np.array([1, 0, 0]), ...
@@ -1,3 +1,5 @@
+import numpy as np
+
 from algorithm.lattice.Voxel import Voxel
 from algorithm.lattice.Lattice import Lattice
 from algorithm.symmetry.Relation import Relation
@@ -81,10 +83,11 @@ class MVoxel:
         if symlist is None or len(symlist) == 0:
             return False, False
 
+        # The first "no relation"/"negation" decides; "equal" only holds if no 
+        # later symmetry contradicts it, so it can't return early
         found_equal = False
         for sym_label in symlist:
             rel = Relation.get_voxel_relation(voxel, mv, sym_label)
-            # print(f"Relation ({rel}) between Voxel {voxel.id} and {self} with sym={sym_label}")
             
             # Mapping logic based on the voxel-voxel relation
             if rel == "no relation":
@@ -94,11 +97,8 @@ class MVoxel:
             elif rel == "equal":
                 found_equal = True
 
-        if found_equal:
-            return True, False
-        
-        else: # all loose - not enough information to map it onto this MVoxel
-            return False, False
+        # found_equal is False if all loose - not enough information to map it onto this MVoxel
+        return found_equal, False
 
 
     def __str__(self):
@@ -127,8 +127,10 @@ class Mesovoxel:
         # these two sets uniquely define the mesovoxel
         self.structural_voxels: set[int] = self.init_structural_voxels()
         self.complementary_voxels: set[int] = set([])
-        
-        self.init_structural_voxels()
+
+        # MVoxels, and the MVoxel.id each voxel is mapped to (indexed by voxel.id, -1 = unmapped)
+        self.mvoxels: list[MVoxel] = []
+        self.voxels = np.full(len(lattice.voxels), -1, dtype=np.int32)
 
     def init_structural_voxels(self) -> set[int]:
         """
@@ -136,20 +138,21 @@ class Mesovoxel:
         Returns:
             structural_voxels: A set of voxel ids (ints) of structural voxels in lattice
         """
+        sym_adj = self.lattice.symmetry_df.sym_adjacency()
+
         # init with first voxel in lattice
         v_0 = self.lattice.voxels[0]
         v_0.set_type("structural")
-        structural_voxels = set([v_0.id]) 
+        structural_mask = np.zeros(len(self.lattice.voxels), dtype=bool)
+        structural_mask[v_0.id] = True
         
         for voxel in self.lattice.voxels[1:]:
-            # check if voxel has symmetry with any current structural_voxels
-            symvoxels = self.lattice.symmetry_df.get_symvoxels(voxel.id)
-
-            # if no symmetries, add voxel to structural_voxels!
-            if not any(sv in structural_voxels for sv in symvoxels):
+            # if no symmetries with any current structural_voxels, add voxel to structural_voxels!
+            if not np.any(sym_adj[voxel.id] & structural_mask):
                 voxel.set_type("structural")
-                structural_voxels.add(voxel.id)
+                structural_mask[voxel.id] = True
 
+        structural_voxels = set(np.flatnonzero(structural_mask).tolist())
         return structural_voxels
     
 
@@ -171,17 +174,16 @@ class Mesovoxel:
             mesoparents: dict {"structural": voxel.id, "complementary": voxel.id}
         """
         mesoparents = dict()
+        symvoxels = set(self.lattice.symmetry_df.get_symvoxels(voxel))
 
         # find all s_voxels with symmetry to the given voxel
         for s_voxel in self.structural_voxels:
-            symlist = self.lattice.symmetry_df.symlist(voxel, s_voxel)
-            if len(symlist) > 0:
+            if s_voxel in symvoxels:
                 mesoparents["structural"] = s_voxel
 
         # also go thru c voxels
         for c_voxel in self.complementary_voxels:
-            symlist = self.lattice.symmetry_df.symlist(voxel, c_voxel)
-            if len(symlist) > 0:
+            if c_voxel in symvoxels:
                 mesoparents["complementary"] = c_voxel
 
         return mesoparents
@@ -200,7 +202,7 @@ class Mesovoxel:
         Check if the the given voxel (id/Voxel) is mapped to an MVoxel in the Mesovoxel
         """
         voxel_id = voxel.id if isinstance(voxel, Voxel) else voxel
-        return True if self.voxels.get(voxel_id) else False
+        return bool(self.voxels[voxel_id] >= 0)
     
 
     def n_mvoxels(self):
@@ -1,4 +1,6 @@
-from typing import Set
+from collections import deque
+
+import numpy as np
 
 from algorithm.lattice.Voxel import Voxel
 from algorithm.lattice.Bond import Bond
@@ -26,9 +28,9 @@ class Painter:
         self.lattice = lattice
         self.mesovoxel = Mesovoxel(lattice, self)
 
-        # Painting sets
-        self.painted_voxels: Set[int] = set() # (int)
-        self.meso_candidates: Set[int] = set() # (int)
+        # Painting worklists (int)
+        self.painted_voxels = VoxelWorklist(len(lattice.voxels))
+        self.meso_candidates = VoxelWorklist(len(lattice.voxels))
 
         # Count of total # colors (not including complementary) 
         # used to paint the MinDesign
@@ -74,7 +76,8 @@ class Painter:
 
         # Iterative self symmetry painting
         while self.painted_voxels:
-            print(f"Iterative self sym painting with painted_voxels{self.painted_voxels}...")
+            if self.verbose:
+                print(f"Iterative self sym painting with painted_voxels{self.painted_voxels}...")
             voxel = self.painted_voxels.pop()
             pv = self.self_sym_paint(voxel)
             self.painted_voxels.update(pv)
@@ -265,26 +268,29 @@ class Painter:
         parent = parent if isinstance(parent, Voxel) else self.lattice.get_voxel(parent)
         child = child if isinstance(child, Voxel) else self.lattice.get_voxel(child)
 
-        print(f"Trying to map parent_{parent.id} onto child_{child.id} with {sym_label} and negation={with_negation}")
+        if self.verbose:
+            print(f"Trying to map parent_{parent.id} onto child_{child.id} with {sym_label} and negation={with_negation}")
         found_bad = False
         # Rotate the bonds of the parent voxel according to the satisfied symmetry operation
         rotated_bond_dict = self.rotater.rotate_voxel(voxel=parent, rot_label=sym_label)
 
         # And copy them over to the child
         painted_voxels = set()
-        comp = -1 if with_negation else 1
 
         for direction, parent_bond in rotated_bond_dict.dict.items():
             child_bond = child.bond_dict.get_bond(direction)
 
             # Don't paint onto already-painted bonds (+ no need to paint None colors)
             if child_bond.color is not None or parent_bond.color is None:
-                print(f"NOOOOO parent vox_{parent.id}'s bond ({parent_bond.get_label()}) tried to paint onto child vox_{child.id}'s bond ({child_bond.get_label()})")
+                if self.verbose:
+                    print(f"NOOOOO parent vox_{parent.id}'s bond ({parent_bond.get_label()}) tried to paint onto child vox_{child.id}'s bond ({child_bond.get_label()})")
                 found_bad = True
                 continue
             
             # Bond color is negated (on c_bonds) if with_negation
-            bond_color = int(parent_bond.color * comp) if parent_bond.type == "complementary" else parent_bond.color
+            bond_color = parent_bond.color
+            if with_negation and parent_bond.type == "complementary":
+                bond_color = -bond_color
             self.paint_bond(child_bond, bond_color, type=parent_bond.type)
 
             # Also paint the partner voxel
@@ -294,7 +300,8 @@ class Painter:
 
             painted_voxels.add(partner_voxel.id)
 
-        print("Map paint encountered unpaintable bond.") if found_bad else print("Done!")
+        if self.verbose:
+            print("Map paint encountered unpaintable bond.") if found_bad else print("Done!")
         
         return painted_voxels
 
@@ -310,10 +317,40 @@ class Painter:
 
         painted_voxels = set()
         for sym_label in symlist:
-            print(f"    self-sym paint: {sym_label}")
+            if self.verbose:
+                print(f"    self-sym paint: {sym_label}")
             pv = self.map_paint(parent=voxel, child=voxel, sym_label=sym_label, with_negation=False)
             painted_voxels.update(pv)
 
         return painted_voxels
     
-        
\ No newline at end of file
+        
+
+
+class VoxelWorklist:
+    """
+    FIFO worklist of voxel ids, in which each voxel is queued at most once at a time.
+    Drop-in for the set-based worklists (update / pop / len) with a deterministic order.
+    """
+    def __init__(self, n_voxels: int):
+        self._queue = deque()
+        self._queued = np.zeros(n_voxels, dtype=bool) # Whether each voxel id is in the queue
+
+    def update(self, voxel_ids) -> None:
+        """Queue all voxel ids which aren't queued yet."""
+        for voxel_id in voxel_ids:
+            if not self._queued[voxel_id]:
+                self._queued[voxel_id] = True
+                self._queue.append(voxel_id)
+
+    def pop(self) -> int:
+        """Pop the voxel id which was queued first."""
+        voxel_id = self._queue.popleft()
+        self._queued[voxel_id] = False
+        return voxel_id
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __repr__(self) -> str:
+        return f"{list(self._queue)}"
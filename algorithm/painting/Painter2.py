@@ -52,7 +52,8 @@ class Painter:
             s_voxel = self.lattice.get_voxel(s_voxel_id)
 
             for direction, bond in s_voxel.bond_dict.dict.items():
-                partner_voxel, partner_bond = s_voxel.get_partner(direction)
+                partner_bond = bond.bond_partner
+                partner_voxel = partner_bond.voxel
 
                 # --- Paint path of structural bonds ---
                 # ensure neither bond is colored yet
@@ -64,8 +65,7 @@ class Painter:
                 
                 # Paint the new bond
                 self.n_colors += 1
-                self.paint_bond(bond, self.n_colors, 'structural')
-                self.paint_bond(partner_bond, -1*self.n_colors, 'structural')
+                self.paint_bond_pair(bond, self.n_colors, 'structural')
 
                 self.self_sym_paint(s_voxel)
                 self.self_sym_paint(partner_voxel)
@@ -116,8 +116,7 @@ class Painter:
                         print(f"--- PAINT C_BOND ({self.n_colors}) --- \nvoxel_{voxel1.id} ({bond1.direction}) <---> voxel_{voxel2.id} ({bond2.direction})\n")
 
                     if bond1.color is None and bond2.color is None:
-                        self.paint_bond(bond=bond1, color=self.n_colors, type="complementary")
-                        self.paint_bond(bond=bond2, color=-self.n_colors, type="complementary")
+                        self.paint_bond_pair(bond=bond1, color=self.n_colors, type="complementary")
 
                     # paint self symmetries
                     self.self_sym_paint(voxel2)
@@ -135,8 +134,7 @@ class Painter:
                         if self.verbose:
                             print(f"--- PAINT C_BOND ({self.n_colors}) --- \nvoxel_{voxel1.id} ({bond1.direction}) <---> voxel_{voxel2.id} ({bond2.direction})\n")
 
-                        self.paint_bond(bond=bond1, color=self.n_colors, type="complementary")
-                        self.paint_bond(bond=bond2, color=-self.n_colors, type="complementary")
+                        self.paint_bond_pair(bond=bond1, color=self.n_colors, type="complementary")
 
                         # add the voxel to the complementary set
                         voxel2.set_type("complementary")
@@ -160,9 +158,17 @@ class Painter:
         if self.verbose:
             print(f"self-sym paint(voxel_{voxel.id})")
 
+        # Same as map_paint(parent=voxel, child=voxel) for each sym_label
         symlist = self.lattice.symmetry_df.symlist(voxel.id, voxel.id)
         for sym_label in symlist:
-            self.map_paint(parent=voxel, child=voxel, sym_label=sym_label)
+            if self.verbose:
+                print(f"    map_paint(parent_{voxel.id} --> child_{voxel.id}, sym={sym_label})")
+
+            # Translation maps every bond onto itself, so there is nothing to paint
+            if sym_label == 'translation':
+                continue
+
+            self._paint_rotated(parent=voxel, child=voxel, sym_label=sym_label)
 
     def map_paint(self, parent, child, sym_label: str):
         """
@@ -179,22 +185,30 @@ class Painter:
         if self.verbose:
             print(f"    map_paint(parent_{parent.id} --> child_{child.id}, sym={sym_label})")
 
-        rotated_parent = self.rotater.rotate_voxel(voxel=parent, rot_label=sym_label) # rotated bond_dict object
+        self._paint_rotated(parent=parent, child=child, sym_label=sym_label)
+
+    def _paint_rotated(self, parent: Voxel, child: Voxel, sym_label: str) -> None:
+        """
+        Paint the parent's bonds, rotated by sym_label, onto the unpainted bonds of
+        the child (+ their partners). The rotation's direction table gives the child 
+        vertex each parent bond lands on, so no rotated BondDict is built.
+        """
+        # Snapshot the (rotated) parent bonds before painting, since the parent can be the child
+        rotated_directions = self.rotater.rotated_directions(sym_label)
+        rotated_parent = [(rotated_directions[direction], bond.color, bond.type) 
+                          for direction, bond in parent.bond_dict.dict.items()]
 
         # Go through and map each parent bond to the child on its corresponding (rotated) vertex
-        for direction, parent_bond in rotated_parent.dict.items():
-            child_bond = child.bond_dict.get_bond(direction)
+        child_bonds = child.bond_dict.dict
+        for direction, color, type in rotated_parent:
+            child_bond = child_bonds[direction]
 
             # don't paint onto already-painted bonds (+ no need to paint None colors)
-            if child_bond.color is not None or parent_bond.color is None:
+            if child_bond.color is not None or color is None:
                 continue
             
-            # Bond color is negated (on c_bonds) if with_negation
-            self.paint_bond(child_bond, parent_bond.color, type=parent_bond.type)
-
-            # Also paint the partner voxel (does the updated script need to do this?)
-            partner_voxel, bond_partner = child.get_partner(direction)
-            self.paint_bond(bond_partner, -1*parent_bond.color, type=parent_bond.type)
+            # Also paints the partner voxel (does the updated script need to do this?)
+            self.paint_bond_pair(child_bond, color, type=type)
 
     def paint_bond(self, bond: Bond, color: int, type: str) -> None:
         """
@@ -205,7 +219,16 @@ class Painter:
             color (int): What color to paint it
             type (str): Either "complementary" or "structural" depending on type of bond to paint
         """
-        # if self.verbose:
-        #     print(f"\t ---> painting {color} onto voxel {bond.voxel.id}'s bond {bond.get_label()} with type {type} ")
-        bond.set_color(color)
-        bond.set_type(type)
\ No newline at end of file
+        bond.paint(color, type)
+
+    def paint_bond_pair(self, bond: Bond, color: int, type: str) -> None:
+        """
+        Paint a bond and its bond partner (with the complementary color) in one call.
+        
+        Args:
+            bond (Bond): The bond object to paint, its bond_partner gets -color
+            color (int): What color to paint the bond
+            type (str): Either "complementary" or "structural" depending on type of bond to paint
+        """
+        bond.paint(color, type)
+        bond.bond_partner.paint(-color, type)
\ No newline at end of file
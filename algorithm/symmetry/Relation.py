@@ -10,6 +10,7 @@ class Relation:
         pass
 
     # Level 1: Bond Relations
+    @staticmethod
     def _get_bond_relation(bond1: Bond, bond2: Bond):
         """
         Get the relation between two bonds - options include:
@@ -41,10 +42,12 @@ class Relation:
         else: 
             return "no relation" # eg, if two s_bonds are opposing complementarity, they are still no relation
         
+    @staticmethod
     def is_bond_equal(bond1, bond2):
         relation = Relation._get_bond_relation(bond1, bond2)
         return True if relation == "equal" else False
     
+    @staticmethod
     def is_loose(bond1, bond2):
         relation = Relation._get_bond_relation(bond1, bond2)
         return True if relation == "loose" else False
@@ -65,54 +68,61 @@ class Relation:
         if voxel1.material != voxel2.material:
             return "no relation"
         
-        if sym_label is None:
-            bond_dict1 = voxel1.bond_dict
-        elif sym_label is not None:
-            bond_dict1 = cls.rotater.rotate_voxel(voxel=voxel1, rot_label=sym_label)
-
-        bond_dict2 = voxel2.bond_dict
+        # Compare voxel1's bonds at their rotated vertices on voxel2, without building 
+        # a rotated BondDict (translation is the identity rotation, nothing to rotate)
+        if sym_label is None or sym_label == 'translation':
+            rotated_directions = None
+        else:
+            rotated_directions = cls.rotater.rotated_directions(sym_label)
 
         # Return the relation between the two bond_dicts
-        return Relation.get_bond_dict_relation(bond_dict1, bond_dict2)
+        return Relation.get_bond_dict_relation(voxel1.bond_dict, voxel2.bond_dict, rotated_directions)
     
     # Internal level 2 relation check logic
-    def get_bond_dict_relation(bond_dict1: BondDict, bond_dict2: BondDict):
+    @staticmethod
+    def get_bond_dict_relation(bond_dict1: BondDict, bond_dict2: BondDict, rotated_directions: dict = None):
         """ 
         Internal method to get the relation between two voxels. Accepts the BondDicts as input.
+        If rotated_directions ({direction: rotated direction}) is given, each bond of
+        bond_dict1 is compared against the bond of bond_dict2 at its rotated direction.
         """
-        # Summing variables
-        equal_count = 0
-        loose_count = 0
-        negation_count = 0
+        # Same logic as _get_bond_relation, inlined since this runs for every
+        # (rotated) voxel pair: we only need to know whether any bond pair is
+        # "equal" / "negation", and stop at the first "no relation"
+        found_equal = False
+        found_negation = False
 
+        bonds2 = bond_dict2.dict
         for direction, bond1 in bond_dict1.dict.items():
-            # Get the bond relation between bonds in the same direction
-            bond2 = bond_dict2.get_bond(direction)
-            bond_relation = Relation._get_bond_relation(bond1, bond2)
+            if rotated_directions is not None:
+                direction = rotated_directions[direction]
+            bond2 = bonds2.get(direction)
+            color1, color2 = bond1.color, bond2.color
 
-            # Keep sum of all bond relations
-            if bond_relation == "equal":
-                equal_count += 1
-            elif bond_relation == "loose":
-                loose_count += 1
-            elif bond_relation == "negation":
-                negation_count += 1
-            
-            # If any bonds are "no relation" then the voxels have no relation as well
-            else: 
+            if color1 == color2:
+                # Equal if both c_bonds, else loose
+                if bond1.type == "complementary" and bond2.type == "complementary":
+                    found_equal = True
+            elif color1 is None or color2 is None:
+                continue # Loose
+            elif color1 == -color2 and bond1.type == "complementary" and bond2.type == "complementary":
+                found_negation = True # Negation can only exist between two c_bonds
+            else:
+                # If any bonds are "no relation" then the voxels have no relation as well
                 return "no relation"
 
         # Check voxel relations based on bond comparisons
         # If any c_bond comparisons are negation, the voxels are negations
-        if negation_count >= 1:
+        if found_negation:
             return "negation"
         # If no negations exist but some satisfy equal, then voxels have equality
-        elif equal_count >= 1:
+        elif found_equal:
             return "equal"
         # Else if all comparisons are loose-loose, then voxels are loose (no info)
         return "loose"
 
         
+    @staticmethod
     def _get_bond_color(bond):
         if isinstance(bond, int):
             return bond
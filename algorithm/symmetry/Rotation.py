@@ -1,3 +1,4 @@
+from itertools import combinations
 import numpy as np
 from scipy.spatial.transform import Rotation as R
 
@@ -49,10 +50,13 @@ class NpRotationDict:
             '270° Z-axis': lambda x: np.rot90(x, 3, (2, 1))
         }
         self.double_rotations = self._init_double_rotations()
+
+        # Every (single or double) rotation only moves elements around, so it is applied 
+        # as one precomputed index permutation instead of chained np.rot90 calls
         self.all_rotations = {
             **self.translation, 
-            **self.single_rotations, 
-            **self.double_rotations
+            **{label: PermutationRotation(rotation) for label, rotation in self.single_rotations.items()},
+            **{label: PermutationRotation(rotation) for label, rotation in self.double_rotations.items()}
         }
 
     def get_rotation(self, rot_label: str):
@@ -61,6 +65,16 @@ class NpRotationDict:
         """
         return self.all_rotations[rot_label]
 
+    def permutations(self, shape: tuple) -> np.ndarray:
+        """
+        Get the flat-index permutations of all_rotations for arrays of the given shape, stacked 
+        so every rotation of an array x is applied in one gather: x.ravel()[permutations]
+        @return:
+            - permutations: (len(all_rotations), x.size) np.array of ints, rows in all_rotations order
+        """
+        template = np.arange(np.prod(shape)).reshape(shape)
+        return np.stack([rotation(template).ravel() for rotation in self.all_rotations.values()])
+
     def _init_double_rotations(cls):
         """
         Initialize double_rotations to contain all possible combinations of single_rotations,
@@ -69,20 +83,17 @@ class NpRotationDict:
             - double_rotations: Dictionary of lambda functions for double rotations
                                 {"label1 + label2": lambda x: rotation2(rotation1(x))}
         """
-        frozen_double_rotations = [] # List to store frozensets of double rotations (avoids duplicates)
-
-        for label1 in cls.single_rotations.keys():
-            for label2 in cls.single_rotations.keys():
-                # Create a frozen set of the pair of rotation labels
-                rotation_pair = frozenset([label1, label2])
+        frozen_double_rotations = [] # List to store frozensets of double rotations
 
-                # Get the last word in string (the axis) from each rotation label
-                rotation1_axis = label1.split(' ')[-1] 
-                rotation2_axis = label2.split(' ')[-1]
+        # Each unordered pair of single rotations once (combinations never repeats a pair)
+        for label1, label2 in combinations(cls.single_rotations.keys(), 2):
+            # Get the last word in string (the axis) from each rotation label
+            rotation1_axis = label1.split(' ')[-1] 
+            rotation2_axis = label2.split(' ')[-1]
 
-                # Only consider double rotation if they are on different axes and not already considered
-                if rotation1_axis != rotation2_axis and rotation_pair not in frozen_double_rotations:
-                    frozen_double_rotations.append(rotation_pair)
+            # Only consider double rotation if they are on different axes
+            if rotation1_axis != rotation2_axis:
+                frozen_double_rotations.append(frozenset([label1, label2]))
         
         # Iterate through list of non-repeating double rotations and create a dictionary of lambda functions
         double_rotations = {}
@@ -98,6 +109,23 @@ class NpRotationDict:
         return sorted_double_rotations
     
 
+class PermutationRotation:
+    """
+    A (numpy) rotation applied as a single fancy-index: the permutation of flat indices
+    it makes is derived once per array shape, by applying the rotation to np.arange.
+    """
+
+    def __init__(self, rotation):
+        self.rotation = rotation
+        self._permutations = {} # {array shape: rotated array of flat indices}
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        permutation = self._permutations.get(x.shape)
+        if permutation is None:
+            permutation = self._permutations[x.shape] = self.rotation(np.arange(x.size).reshape(x.shape))
+        return x.ravel()[permutation]
+
+
 class ScipyRotationDict:
     """
     Class for (scipy) rotations for transforming the vertices based on euclidean 
@@ -126,6 +154,13 @@ class ScipyRotationDict:
             **self.double_rotations
         }
 
+        # All rotations are multiples of 90°, so each one is an exact integer (0/±1) matrix:
+        # evaluate every rotation once on the basis vectors, M @ x == rotation(x)
+        self.matrices = {
+            rot_label: np.rint(rotation(np.eye(3))).astype(np.int8).T
+            for rot_label, rotation in self.all_rotations.items()
+        }
+
     def get_rotation(self, rot_label: str):
         """
         Get the rotation function based on the label (ex: '90° X-axis', '180° Y-axis', etc.)
@@ -134,6 +169,15 @@ class ScipyRotationDict:
             raise ValueError(f"Invalid rotation label: {rot_label}")
         
         return self.all_rotations.get(rot_label)
+
+    def get_matrix(self, rot_label: str) -> np.ndarray:
+        """
+        Get the integer (3, 3) rotation matrix based on the label (ex: '90° X-axis', '180° Y-axis', etc.)
+        """
+        if rot_label not in self.matrices:
+            raise ValueError(f"Invalid rotation label: {rot_label}")
+        
+        return self.matrices[rot_label]
     
     def _init_double_rotations(self):
         """
@@ -143,20 +187,17 @@ class ScipyRotationDict:
             - double_rotations: Dictionary of lambda functions for double rotations
                                 {"label1 + label2": lambda x: rotation2(rotation1(x))}
         """
-        frozen_double_rotations = [] # List to store frozensets of double rotations (avoids duplicates)
-
-        for label1 in self.single_rotations.keys():
-            for label2 in self.single_rotations.keys():
-                # Create a frozen set of the pair of rotation labels
-                rotation_pair = frozenset([label1, label2])
+        frozen_double_rotations = [] # List to store frozensets of double rotations
 
-                # Get the last word in string (the axis) from each rotation label
-                rotation1_axis = label1.split(' ')[-1] 
-                rotation2_axis = label2.split(' ')[-1]
+        # Each unordered pair of single rotations once (combinations never repeats a pair)
+        for label1, label2 in combinations(self.single_rotations.keys(), 2):
+            # Get the last word in string (the axis) from each rotation label
+            rotation1_axis = label1.split(' ')[-1] 
+            rotation2_axis = label2.split(' ')[-1]
 
-                # Only consider double rotation if they are on different axes and not already considered
-                if rotation1_axis != rotation2_axis and rotation_pair not in frozen_double_rotations:
-                    frozen_double_rotations.append(rotation_pair)
+            # Only consider double rotation if they are on different axes
+            if rotation1_axis != rotation2_axis:
+                frozen_double_rotations.append(frozenset([label1, label2]))
         
         # Iterate through list of non-repeating double rotations and create a dictionary of lambda functions
         double_rotations = {}
@@ -176,6 +217,40 @@ class Rotater:
     def __init__(self):
         self.scirot_dict = ScipyRotationDict()
 
+        # {rot_label: {direction: rotated direction}}, see rotated_directions()
+        self._rotated_directions = self._init_rotated_directions()
+
+    def rotated_directions(self, rot_label: str) -> dict[tuple, tuple]:
+        """
+        Get where each vertex direction ends up under a rotation.
+
+        Args:
+            rot_label (str): The rotation label to be applied.
+
+        Returns:
+            rotated_directions (dict): {direction: rotated direction} for all Voxel.vertex_directions
+        """
+        rotated_directions = self._rotated_directions.get(rot_label)
+        if rotated_directions is None:
+            raise ValueError(f"Invalid rotation label: {rot_label}")
+        return rotated_directions
+
+    def _init_rotated_directions(self) -> dict[str, dict[tuple, tuple]]:
+        """
+        Rotate all vertex directions by every rotation at once: one stacked (R, 6, 3) 
+        product of the vertex directions with the R (integer) rotation matrices, 
+        no float rounding needed.
+        @return:
+            - rotated_directions: {rot_label: {direction: rotated direction}}
+        """
+        rot_labels = list(self.scirot_dict.matrices)
+        rotation_matrices = np.stack([self.scirot_dict.matrices[rot_label] for rot_label in rot_labels])
+        directions = np.array(Voxel.vertex_directions, dtype=np.int8)
+        rotated = (directions @ rotation_matrices.transpose(0, 2, 1)).tolist()
+
+        return {rot_label: dict(zip(Voxel.vertex_directions, map(tuple, rotated_rows)))
+                for rot_label, rotated_rows in zip(rot_labels, rotated)}
+
     def rotate_voxel(self, voxel: Voxel, rot_label: str) -> BondDict:
         """
         Rotates a single voxel and returns a dictionary containing the rotated 
@@ -189,14 +264,12 @@ class Rotater:
             bond_dict (BondDict): A dictionary where keys are the rotated directions 
                               and values are tuples of (bond colors, bond types).
         """
-        rot = self.scirot_dict.get_rotation(rot_label)
+        rotated_directions = self.rotated_directions(rot_label)
         
         bond_dict = BondDict()
         for direction, bond in voxel.bond_dict.dict.items():
-            # Rotate the direction vector of the bond
-            direction = np.array(direction)
-            rotated_direction = rot(direction)
-            rotated_direction = tuple(np.round(rotated_direction).astype(int)) # format it as a tuple
+            # Rotate the direction vector of the bond (memoized per rot_label)
+            rotated_direction = rotated_directions[direction]
 
             # Store the color in the bond_dict with the rotated direction as the key
             rotated_bond = Bond(
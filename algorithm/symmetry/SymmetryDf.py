@@ -16,16 +16,19 @@ class SymmetryDf:
         - Surroundings: Surroundings object
         - symmetry_operations: Dictionary of all possible symmetry operations
         - symmetry_df: pd.DataFrame object containing all voxel pairs and their symmetries
+                       (built on first access from sym_matrix(), for inspection)
     
     Public:
         - symlist(v1, v2): Get the list of symmetries for a specific voxel pair v1 and v2
         - symdict(v): Get a dictionary of all possible non-empty symlists containing the voxel v 
                       eg, {sv: symlist(v, sv)}
         - symvoxels(v): Get list of all other voxels in lattice which voxel v has symmetry with
+        - sym_matrix(): Get the N x N x K boolean tensor of which symmetries each voxel pair has
+        - sym_adjacency(): Get the N x N boolean matrix of voxel pairs with any symmetry
         - print_all_symdicts(): Print all possible symdicts for all voxels in the Lattice.MinDesign
     
     Internal:
-        - _init_symmetry_df(): Initialize an empty symmetry_df with all possible voxel pairs and symmetry operations
+        - _build_symmetry_df(): Build symmetry_df from sym_matrix(), with all possible voxel pairs and symmetry operations
         - _compute_all_symmetries(): Compute all possible symmetries between all 2-combinations of voxels
     """
     
@@ -39,12 +42,22 @@ class SymmetryDf:
 
         # Create dictionary of all possible symmetry operations
         # Ex: {'90° X-axis': lambda x: np.rot90(x, 1, (0, 1)), ...}
-        self.symmetry_operations = NpRotationDict().all_rotations
+        self.rotation_dict = NpRotationDict()
+        self.symmetry_operations = self.rotation_dict.all_rotations
         
-        # The SymmetryDf data structure containing all voxel pairs and their symmetries
-        # Ex: (0, 1): {'90° X-axis': True, '180° Y-axis': False, ...}
-        self.symmetry_df = self._init_symmetry_df()
-        self._compute_all_symmetries() # Fill all symmetries in place
+        self.sym_labels = list(self.symmetry_operations.keys()) # Symmetry label of each sym_matrix() plane
+        
+        # The SymmetryDf data structure containing all voxel pairs and their symmetries,
+        # indexed by voxel ids and symmetry (sym_labels position)
+        # Ex: [0, 1]: [True, False, ...] for ['90° X-axis', '180° Y-axis', ...]
+        self._sym_matrix = self._compute_all_symmetries()
+
+        # Lookup tables read off sym_matrix() once it is filled, see symmetry_df,
+        # _symlist_table(), sym_adjacency() and _symvoxel_table()
+        self._symmetry_df = None
+        self._symlists = None
+        self._sym_adj = None
+        self._symvoxels = None
     
 
     def symlist(self, voxel1, voxel2) -> list[str]:
@@ -60,14 +73,10 @@ class SymmetryDf:
         """
         voxel1_id = voxel1.id if isinstance(voxel1, Voxel) else voxel1
         voxel2_id = voxel2.id if isinstance(voxel2, Voxel) else voxel2
-        voxel_pair_label = VoxelPair.make_label(frozenset([voxel1_id, voxel2_id]))
-
-        # Get those symmetries which are True for the voxel pair
-        all_symmetries = self.symmetry_df.loc[voxel_pair_label]
-        valid_symmetries = all_symmetries[all_symmetries == True].index
-        symlist = list(valid_symmetries)
+        pair_key = (min(voxel1_id, voxel2_id), max(voxel1_id, voxel2_id))
 
-        return symlist
+        symlist = self._symlist_table().get(pair_key, [])
+        return list(symlist) # Copy, so callers can't edit the cached symlist
     
     def symdict(self, voxel) -> dict[str, list]:
         """
@@ -85,13 +94,8 @@ class SymmetryDf:
              4: ['90° Z-axis', '270° X-axis']}
         """
         voxel_id = voxel.id if isinstance(voxel, Voxel) else voxel
-        symdict = {}
-        for voxel2 in self.lattice.voxels:
-            current_symlist = self.symlist(voxel_id, voxel2.id)
-            # only add symlists for voxel pairs with valid symmetries
-            if len(current_symlist) > 0:
-                # voxel_pair_label = VoxelPair.make_label(frozenset([id, voxel2.id]))
-                symdict[voxel2.id] = current_symlist
+        # only voxel pairs with valid symmetries
+        symdict = {voxel2_id: self.symlist(voxel_id, voxel2_id) for voxel2_id in self._symvoxel_table()[voxel_id]}
         return symdict
 
     def get_symvoxels(self, voxel: int) -> list[int]:
@@ -103,66 +107,127 @@ class SymmetryDf:
             voxel: Voxel or id (int) of what voxel we want to get the symvoxels for
         """
         voxel_id = voxel.id if isinstance(voxel, Voxel) else voxel
-        symdict = self.symdict(voxel_id)
-        symvoxels = [sv for sv in symdict.keys()]
+        symvoxels = list(self._symvoxel_table()[voxel_id])
         return symvoxels
     
+    def sym_matrix(self) -> np.ndarray:
+        """
+        Get the symmetric N x N x K boolean tensor of which of the K symmetry operations 
+        map each voxel pair onto each other.
+        Returns:
+            sym_matrix: np.ndarray(bool), sym_matrix[v1, v2, k] is True if sym_labels[k] 
+                        is in symlist(v1, v2)
+        """
+        return self._sym_matrix
+
+    @property
+    def symmetry_df(self) -> pd.DataFrame:
+        """
+        The symmetry table as a pd.DataFrame (built once, on first access): one row per 
+        voxel pair label, eg. "(0, 1)", and one column per symmetry label.
+        """
+        if self._symmetry_df is None:
+            self._symmetry_df = self._build_symmetry_df()
+        return self._symmetry_df
+
+    def sym_adjacency(self) -> np.ndarray:
+        """
+        Get (built once, from sym_matrix()) the symmetric N x N boolean matrix of which 
+        voxel pairs have at least one symmetry.
+        Returns:
+            sym_adj: np.ndarray(bool), sym_adj[v1, v2] is True if len(symlist(v1, v2)) > 0
+        """
+        if self._sym_adj is None:
+            self._sym_adj = self.sym_matrix().any(axis=2)
+        return self._sym_adj
+
     # --- internal ---
-    def _init_symmetry_df(self) -> pd.DataFrame:
+    def _symlist_table(self) -> dict[tuple[int, int], list[str]]:
+        """
+        Build (once) the symlist of every voxel pair with any symmetry from sym_matrix(), 
+        instead of one .loc lookup per symlist call.
+        @return:
+            - symlists: {(min id, max id): symlist}, pairs without symmetries are left out
+        """
+        if self._symlists is None:
+            sym_matrix = self.sym_matrix()
+            sym_labels = np.array(self.sym_labels, dtype=object)
+            voxel1_ids, voxel2_ids = np.nonzero(np.triu(self.sym_adjacency()))
+            self._symlists = {(voxel1_id, voxel2_id): sym_labels[sym_matrix[voxel1_id, voxel2_id]].tolist()
+                              for voxel1_id, voxel2_id in zip(voxel1_ids.tolist(), voxel2_ids.tolist())}
+        return self._symlists
+
+    def _symvoxel_table(self) -> dict[int, list[int]]:
         """
-        Initialize an empty symmetry_df with all possible voxel pairs as the index, with 
-        empty columns corresponding symmetry operations to be filled later.
+        Build (once) the symvoxels of every voxel from the rows of sym_adjacency(),
+        instead of one symlist lookup per voxel pair.
+        @return:
+            - symvoxels: {voxel.id: sorted list of voxel ids it has symmetry with}
+        """
+        if self._symvoxels is None:
+            sym_adj = self.sym_adjacency()
+            self._symvoxels = {voxel.id: np.flatnonzero(sym_adj[voxel.id]).tolist() 
+                               for voxel in self.lattice.voxels}
+        return self._symvoxels
+
+    def _build_symmetry_df(self) -> pd.DataFrame:
+        """
+        Build symmetry_df from sym_matrix(), with all possible voxel pairs as the index and 
+        the symmetry operations as the columns.
         @return:
             - symmetry_df: pd.DataFrame object
         """
-        # Create a list of all possible voxel pairs
-        voxel_pairs_set = set()
-        for voxel1 in self.lattice.voxels:
-            for voxel2 in self.lattice.voxels:
-                voxel_pairs_set.add(frozenset([voxel1.id, voxel2.id]))
-        
-        # Convert the set of frozensets to a list of formatted strings
-        # E.g., "frozenset({0, 1})" -> "(0, 1)"
-        sorted_voxel_pairs_set = sorted(voxel_pairs_set) # Sort lexicographically
-        voxel_pairs = [VoxelPair.make_label(pair) for pair in sorted_voxel_pairs_set]
+        # All possible (unordered) voxel pairs, in (voxel1, voxel2) order with voxel1 <= voxel2
+        voxel1_ids, voxel2_ids = np.triu_indices(len(self.lattice.voxels))
+
+        # Format the voxel pairs as labels, E.g., (0, 1) -> "(0, 1)" and (2, 2) -> "(2)"
+        voxel_pairs = [VoxelPair.make_label(frozenset([voxel1_id, voxel2_id])) 
+                       for voxel1_id, voxel2_id in zip(voxel1_ids.tolist(), voxel2_ids.tolist())]
 
         # Create a dataframe containing True or False for each symmetry operation as the column names
-        symmetry_df = pd.DataFrame(index=voxel_pairs, columns=self.symmetry_operations.keys())
-        # symmetry_df = symmetry_df.fillna(None) # Fill NaN values with None
+        symmetry_df = pd.DataFrame(self._sym_matrix[voxel1_ids, voxel2_ids], index=voxel_pairs, columns=self.sym_labels)
 
         return symmetry_df
     
-    def _compute_all_symmetries(self):
+    def _compute_all_symmetries(self) -> np.ndarray:
         """
         Compute all possible symmetries between all 2-combinations of voxels
-        in the Lattice.MinDesign. Fills self.symmetry_df in place with the results.
+        in the Lattice.MinDesign.
+        @return:
+            - sym_matrix: (N, N, K) np.ndarray(bool) of the results, see sym_matrix()
         """
-        for sym_label, sym_function in self.symmetry_operations.items():
-
-            # Loop through all possible voxel pairs
-            for voxel1 in self.lattice.voxels:
-
-                # Transform surroundings of voxel1 once per symmetry
-                voxel1_surroundings = self.surroundings.voxel_surroundings(voxel1)
-                transformed_voxel1_surroundings = sym_function(voxel1_surroundings)
-
-                for voxel2 in self.lattice.voxels:
-                    # Make voxel pair label (str) to index into SymmetryDf
-                    voxel_pair_label = VoxelPair.make_label(frozenset([voxel1.id, voxel2.id])) 
-
-                    # print(f'Checking symmetry for {voxel_pair_label} with {sym_label}...') # debug
-    
-                    symmetry_already_computed = not pd.isna(self.symmetry_df.loc[voxel_pair_label, sym_label])
-
-                    if symmetry_already_computed:
-                        continue # Symmetry already exists in symmetry_df
-
-                    # Check symmetry:
-                    # Two voxels are symmetric if their surroundings are the same after one is transformed
-                    voxel2_surroundings = self.surroundings.voxel_surroundings(voxel2)
-                    has_symmetry = np.array_equal(transformed_voxel1_surroundings, voxel2_surroundings) 
-
-                    self.symmetry_df.loc[voxel_pair_label, sym_label] = has_symmetry # Store the result in symmetry_df
+        # Surroundings of every voxel, looked up once and stacked: (N, a, b, c)
+        all_surroundings = np.stack([self.surroundings.voxel_surroundings(voxel) for voxel in self.lattice.voxels])
+        n_voxels = len(all_surroundings)
+
+        # Fingerprint every distinct surroundings with a small int (all surroundings share one 
+        # shape and dtype, so two are equal exactly when their bytes are): equal fingerprints 
+        # <=> equal surroundings, with no hash collisions possible
+        fingerprints = {} # {surroundings bytes: fingerprint}
+        surroundings_fingerprints = np.array([fingerprints.setdefault(surroundings.tobytes(), len(fingerprints)) 
+                                              for surroundings in all_surroundings])
+
+        # Transform the surroundings of every voxel by every symmetry in one gather with the 
+        # symmetries' index permutations: (N, K, a * b * c)
+        permutations = self.rotation_dict.permutations(all_surroundings.shape[1:])
+        n_symmetries = len(permutations)
+        transformed_surroundings = all_surroundings.reshape(n_voxels, -1)[:, permutations]
+
+        # and fingerprint them (-1 if the transformed surroundings are not any voxel's surroundings): (N, K)
+        transformed_fingerprints = np.array([fingerprints.get(surroundings.tobytes(), -1) 
+                                             for surroundings in transformed_surroundings.reshape(-1, permutations.shape[1])])
+        transformed_fingerprints = transformed_fingerprints.reshape(n_voxels, n_symmetries)
+
+        # Check symmetry, for each unordered voxel pair once (voxel1 <= voxel2) and all symmetries at once:
+        # Two voxels are symmetric if their surroundings are the same after one is transformed
+        # (the voxel with the lower id is the transformed one), ie. their fingerprints match
+        voxel1_ids, voxel2_ids = np.triu_indices(n_voxels)
+        has_symmetry = transformed_fingerprints[voxel1_ids] == surroundings_fingerprints[voxel2_ids, None]
+
+        sym_matrix = np.zeros((n_voxels, n_voxels, n_symmetries), dtype=bool)
+        sym_matrix[voxel1_ids, voxel2_ids] = sym_matrix[voxel2_ids, voxel1_ids] = has_symmetry
+
+        return sym_matrix
 
     # info / print function
     def print_all_symdicts(self) -> None:
@@ -1,5 +1,4 @@
 import pyqtgraph.opengl as gl
-import numpy as np
 from algorithm.lattice.Bond import Bond as AlgorithmBond
 from .ColorDict import ColorDict
 from ..config import AppConfig
@@ -30,6 +29,15 @@ class Bond:
         (0, 0, 1): (0, 0, 0, 1),    # +z
         (0, 0, -1): (180, 0, 1, 0)  # -z
     }
+    # Rotation facing the opposite of each direction (reversed arrowheads)
+    reverse_rotate_dict = {
+        (1, 0, 0): rotate_dict[(-1, 0, 0)],
+        (-1, 0, 0): rotate_dict[(1, 0, 0)],
+        (0, 1, 0): rotate_dict[(0, -1, 0)],
+        (0, -1, 0): rotate_dict[(0, 1, 0)],
+        (0, 0, 1): rotate_dict[(0, 0, -1)],
+        (0, 0, -1): rotate_dict[(0, 0, 1)]
+    }
 
     @classmethod
     def create_bond_old2(cls, bond: AlgorithmBond):
@@ -124,7 +132,7 @@ class Bond:
         # Negative bond colors imply complementarity, so reverse the arrowhead direction
         # Rotate the arrowhead to face the correct direction
         if bond.color < 0:
-            arrowhead_rotation = cls.rotate_dict[tuple(-np.array(bond.direction))]
+            arrowhead_rotation = cls.reverse_rotate_dict[bond.direction]
         else:
             arrowhead_rotation = cls.rotate_dict[bond.direction]
         
@@ -1,23 +1,64 @@
 import itertools
 import math
+import multiprocessing
+import random
 import sys
+from collections import OrderedDict
+
+import numpy as np
+
 from .Lattice import Lattice
 
+# Max number of colorings whose unique origami count is memoized (least recently used evicted)
+UNIQUE_COUNTS_CACHE_SIZE = 4096
+
+# Per-process state for parallel color-wise evaluation (see _init_worker)
+_worker_lattice = None
+_worker_color_configs = None
+_worker_max_ties = None
+_worker_seed = None
+
+
 class ColorTree:
-    def __init__(self, lattice: Lattice):
+    __slots__ = ('lattice', 'colordict', 'all_color_configs', 'reduced_color_configs',
+                 '_config_lengths', 'optimal_path', 'n_workers', 'max_ties', 'seed',
+                 '_unique_counts')
+
+    def __init__(self, lattice: Lattice, n_workers: int = 1, max_ties: int = None, seed: int = 0):
         """
         Initializes the optimizer with the lattice and all possible color configurations.
+
+        Args:
+            lattice: The (painted) Lattice to optimize
+            n_workers: Number of processes used to evaluate colors in parallel
+                       during the color-wise reduction (1 = run serially). Workers are
+                       forked so they inherit the lattice (a Lattice can't be pickled),
+                       so n_workers > 1 needs the POSIX 'fork' start method
+            max_ties: Maximum number of equally-good configs kept per color
+                      (None keeps all of them)
+            seed: Seed of the random sampling of ties when more than max_ties configs
+                  tie for a color (the same seed gives the same result, serially or in parallel)
         """
+        if n_workers > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+            raise ValueError("n_workers > 1 needs the 'fork' start method, which is only available on POSIX")
+
         self.lattice = lattice
+        self.n_workers = n_workers
+        self.max_ties = max_ties
+        self.seed = seed
         self.colordict = lattice.init_colordict()
         self.all_color_configs = self.lattice.init_all_color_configs()
+        self.reduced_color_configs = {}
+        self._config_lengths = {} # {color: len(reduced_color_configs[color])}
+        self._unique_counts = OrderedDict() # LRU {lattice.color_state(): unique origami count}
         self.optimal_path = {}
 
     def optimize(self, end_early=False):
         """
         Finds the optimal path of color configurations that minimizes the unique origami count.
         """
-        self.reduced_color_configs = self._reduce_color_configs(self.all_color_configs)
+        reduced_color_configs = self._reduce_color_configs(self.all_color_configs)
+        self._recompute_color_config_combinations(reduced_color_configs)
         self.optimal_path = self._find_minimal_path(self.reduced_color_configs, end_early=end_early)
         return self.optimal_path
     
@@ -31,96 +72,117 @@ class ColorTree:
 
         print(f"Evaluating color-wise configurations for {total_colors} colors...")
 
-        for color_index, (color, configs) in enumerate(all_color_configs.items(), 1):
-
-            best_configs = []
-            min_unique_count = float('inf')
-            total_configs = len(configs)
-            for config_index, config in enumerate(configs, 1):
-                color_config = {color: config}
-                self.lattice.apply_color_configs(self.lattice.default_color_config) # Reset
-                self.lattice.apply_color_configs(color_config)
-                unique_count = len(self.lattice.unique_origami())
-
-                # Add the color config to the best_configs list if it has the lowest unique count
-                if unique_count < min_unique_count:
-                    min_unique_count = unique_count
-                    best_configs = [config]
-                elif unique_count == min_unique_count:
-                    best_configs.append(config)
-
-                # Update the loading message in place
-                print(f"Evaluating color {color_index}/{total_colors}, config {config_index}/{total_configs}...", end='\r', flush=True)
-
-            new_all_color_configs[color] = best_configs
+        # Drop configs which are equivalent to an already-kept config
+        all_color_configs = {
+            color: _drop_negated_configs(configs, self.colordict[color])
+            for color, configs in all_color_configs.items()
+        }
+
+        if self.n_workers > 1:
+            # Each worker receives the lattice + configs once, so every task is just a color.
+            # Forked workers inherit them without pickling (the lattice's symmetry_df holds
+            # lambdas, so it can't be sent to spawned workers)
+            with multiprocessing.get_context('fork').Pool(
+                processes=self.n_workers,
+                initializer=_init_worker,
+                initargs=(self.lattice, all_color_configs, self.max_ties, self.seed)
+            ) as pool:
+                all_best_indices = pool.map(_reduce_color_worker, all_color_configs.keys())
+
+            for (color, configs), best_indices in zip(all_color_configs.items(), all_best_indices):
+                new_all_color_configs[color] = [configs[i] for i in best_indices]
+
+        else:
+            for color_index, (color, configs) in enumerate(all_color_configs.items(), 1):
+                progress = f"Evaluating color {color_index}/{total_colors}"
+                best_indices = _reduce_color(self.lattice, color, configs, self.max_ties,
+                                             rng=_color_rng(self.seed, color),
+                                             unique_counts=self._unique_counts, progress=progress)
+                new_all_color_configs[color] = [configs[i] for i in best_indices]
 
         # Final message after the loop completes
         print("\nDone with color-wise evaluation.")
 
         return new_all_color_configs
         
-    def _recompute_color_config_combinations(self, all_color_configs):
+    def _recompute_color_config_combinations(self, reduced_color_configs):
         """
-        Recomputes the color config combinations based on the reduced color configs.
+        Stores the (already) reduced color configs and returns the number of
+        color config combinations they span. Per-color lengths are cached in
+        self._config_lengths so the product never has to re-walk the configs.
         """
-        reduced_color_configs = self._reduce_color_configs(all_color_configs)
-        # color_config_combinations = itertools.product(
-        #     *[[(color, config) for config in configs] for color, configs in reduced_color_configs.items()]
-        # )
-        num_combinations = math.prod(len(configs) for configs in all_color_configs.values())
+        self.reduced_color_configs = reduced_color_configs
+        self._config_lengths = {color: len(configs) for color, configs in reduced_color_configs.items()}
+        num_combinations = math.prod(self._config_lengths.values())
         return num_combinations
     
     def _find_minimal_path(self, all_color_configs, end_early=False):
         """
         Finds the path with the minimal unique_origami count by testing all possible
         combinations of one color_config from each color.
-        """
-        count = 0
-
-        colors = all_color_configs.keys()
-        color_config_combinations = itertools.product(
-            *[[(color, config) for config in configs] for color, configs in all_color_configs.items()]
-        )
 
-        # all_color_configs = lattice.init_all_color_configs()
-        for color in all_color_configs:
-            print(f'Color {color} has {len(all_color_configs[color])} configurations.')
-
-        num_combinations = math.prod(len(configs) for configs in all_color_configs.values())
-        print(f"Searching for minimum origami across {num_combinations} possibilities...")
-
-        min_unique_count = len(self.lattice.unique_origami())
+        Whenever a new minimum shrinks the reduced search space, the search restarts
+        on the smaller space (in a loop, not recursively) and keeps the best path and
+        unique count found so far.
+        """
+        min_unique_count = _cached_unique_origami_count(self.lattice, self._unique_counts)
         optimal_path = None
 
-        # Iterate through each combination
-        for i, combination in enumerate(color_config_combinations, 1):
-            current_path = {color: config for color, config in combination}
-            self.lattice.apply_color_configs(current_path)
-            unique_count = len(self.lattice.unique_origami())
+        while True:
+            # Search colors with the fewest configs first (stable for equal lengths)
+            all_color_configs = dict(sorted(all_color_configs.items(), key=lambda item: len(item[1])))
 
-            # Update the loading message in place
-            print(f"Evaluating {i}/{num_combinations}...", end='\r', flush=True)
+            # Paths are plain tuples of configs, ordered like `colors`
+            # (only a new optimal path is converted back into a dict)
+            colors = tuple(all_color_configs.keys())
+            color_config_combinations = itertools.product(*all_color_configs.values())
 
-            if unique_count < min_unique_count:
-                min_unique_count = unique_count
-                optimal_path = current_path
+            # The configs are flips relative to the default configs they were built from. A new
+            # minimum recomputes the lattice's defaults, so keep the ones this product refers to
+            path_defaults = {color: dict(self.lattice.default_color_config[color]) for color in colors}
 
-                # Recompute the reduced color configs with the new optimal path
-                new_all_color_configs = self.lattice.init_all_color_configs()
-                self.reduced_color_configs = self._reduce_color_configs(new_all_color_configs)
-                new_num_combinations = self._recompute_color_config_combinations(self.reduced_color_configs)
+            for color in all_color_configs:
+                print(f'Color {color} has {self._config_lengths[color]} configurations.')
 
-                if new_num_combinations < num_combinations:
+            num_combinations = math.prod(self._config_lengths.values())
+            print(f"Searching for minimum origami across {num_combinations} possibilities...")
 
-                    # Rerun the search with the updated configs
-                    print(f"Found {min_unique_count} new minimum unique origami. Reducing search space to {new_num_combinations} possibilities...")
-                    return self._find_minimal_path(self.reduced_color_configs, end_early=end_early)
+            search_space_reduced = False
 
-                # count += 1
+            # Iterate through each combination
+            for i, current_path in enumerate(color_config_combinations, 1):
+                for color, config in zip(colors, current_path):
+                    self.lattice.apply_color_config(
+                        color, self.lattice.materialize_color_config(color, config, path_defaults[color])
+                    )
+                unique_count = _cached_unique_origami_count(self.lattice, self._unique_counts)
 
-                # if end_early is True and count == 1:
-                #     print(f"Ending early after finding {min_unique_count} minimum unique origami.")
-                #     return optimal_path
+                # Update the loading message in place
+                print(f"Evaluating {i}/{num_combinations}...", end='\r', flush=True)
+
+                if unique_count < min_unique_count:
+                    min_unique_count = unique_count
+                    # Store full configs: the defaults the flips are relative to change below
+                    optimal_path = {
+                        color: self.lattice.materialize_color_config(color, config, path_defaults[color])
+                        for color, config in zip(colors, current_path)
+                    }
+
+                    # Recompute the reduced color configs with the new optimal path
+                    new_all_color_configs = self.lattice.init_all_color_configs()
+                    new_num_combinations = self._recompute_color_config_combinations(
+                        self._reduce_color_configs(new_all_color_configs)
+                    )
+
+                    if new_num_combinations < num_combinations:
+                        # Restart the search with the updated configs
+                        print(f"Found {min_unique_count} new minimum unique origami. Reducing search space to {new_num_combinations} possibilities...")
+                        all_color_configs = self.reduced_color_configs
+                        search_space_reduced = True
+                        break
+
+            if not search_space_reduced:
+                break
 
         # Final message after the loop completes
         print(f"Done! {min_unique_count} minimum unique origami found.")
@@ -137,6 +199,116 @@ class ColorTree:
                 print(f'Voxel{voxel}: {complementarity}.')
 
 
+def _drop_negated_configs(configs: list[int], voxel_ids: list[int]) -> list[int]:
+    """
+    Remove every config whose full negation (all complementarities flipped) is
+    already kept. Flipping a color everywhere just swaps the color with its
+    complement, so both configs give the same unique origami count in any
+    combination with the other colors - one of them is redundant.
+
+    Configs are bitmasks of the voxel_ids flipped from the default configuration,
+    so the negation of a config flips exactly the other bits.
+    """
+    all_voxels = (1 << len(voxel_ids)) - 1
+
+    kept_configs = []
+    kept_configs_set = set()
+    for config in configs:
+        if config ^ all_voxels in kept_configs_set:
+            continue
+        kept_configs.append(config)
+        kept_configs_set.add(config)
+    return kept_configs
+
+
+def _cached_unique_origami_count(lattice, unique_counts: OrderedDict) -> int:
+    """
+    Unique origami count of the lattice's current coloring, memoized on its color state.
+    Lets the path search skip colorings already evaluated during the reduction
+    (or before a restart). At most UNIQUE_COUNTS_CACHE_SIZE counts are kept, the least
+    recently used being evicted first.
+    """
+    if unique_counts is None:
+        return lattice.unique_origami_count()
+
+    color_state = lattice.color_state()
+    unique_count = unique_counts.get(color_state)
+    if unique_count is None:
+        unique_count = lattice.unique_origami_count()
+        unique_counts[color_state] = unique_count
+        if len(unique_counts) > UNIQUE_COUNTS_CACHE_SIZE:
+            unique_counts.popitem(last=False)
+    else:
+        unique_counts.move_to_end(color_state)
+    return unique_count
+
+
+def _color_rng(seed: int, color: int) -> random.Random:
+    """Random generator for sampling the ties of one color, seeded from seed and the color."""
+    return random.Random(f"{seed}:{color}")
+
+
+def _reduce_color(lattice, color: int, configs: list[int], max_ties: int = None,
+                  rng: random.Random = None, unique_counts: OrderedDict = None, progress: str = None) -> list[int]:
+    """
+    Sweep all configs of a single color and return the indices of those with
+    the lowest unique origami count. If more than max_ties configs tie for the
+    minimum, a uniform sample of max_ties of them is kept (reservoir sampling
+    driven by rng, a fixed-seed generator if not supplied).
+    Evaluated counts are stored in unique_counts (if supplied).
+    """
+    # Reset once per color: every config of this color covers all of its
+    # voxels, so each apply below fully overwrites the previous config
+    lattice.apply_color_configs(lattice.default_color_config)
+
+    if rng is None:
+        rng = _color_rng(0, color)
+
+    best_indices = []
+    n_ties = 0 # Number of configs seen so far with min_unique_count
+    min_unique_count = sys.maxsize # int sentinel keeps the comparison on the int fast path
+    total_configs = len(configs)
+    for config_index, config in enumerate(configs):
+        lattice.apply_color_config(color, config)
+        unique_count = _cached_unique_origami_count(lattice, unique_counts)
+
+        # Keep the indices of the configs with the lowest unique count
+        if unique_count < min_unique_count:
+            min_unique_count = unique_count
+            best_indices = [config_index]
+            n_ties = 1
+        elif unique_count == min_unique_count:
+            n_ties += 1
+            if max_ties is None or len(best_indices) < max_ties:
+                best_indices.append(config_index)
+            else:
+                # Replace a kept tie with probability max_ties / n_ties
+                slot = rng.randrange(n_ties)
+                if slot < max_ties:
+                    best_indices[slot] = config_index
+
+        # Update the loading message in place
+        if progress is not None:
+            print(f"{progress}, config {config_index + 1}/{total_configs}...", end='\r', flush=True)
+
+    return sorted(best_indices)
+
+
+def _init_worker(lattice, all_color_configs, max_ties, seed) -> None:
+    """Store a process-local copy of the lattice and color configs."""
+    global _worker_lattice, _worker_color_configs, _worker_max_ties, _worker_seed
+    _worker_lattice = lattice
+    _worker_color_configs = all_color_configs
+    _worker_max_ties = max_ties
+    _worker_seed = seed
+
+
+def _reduce_color_worker(color: int) -> list[int]:
+    """Pool task: run _reduce_color on the process-local lattice."""
+    return _reduce_color(_worker_lattice, color, _worker_color_configs[color], _worker_max_ties,
+                         rng=_color_rng(_worker_seed, color))
+
+
 class LatticeColorTree:
     """Interface for extending lattice to work with ColorTree"""
     def __init__(self, lattice: Lattice):
@@ -147,27 +319,38 @@ class LatticeColorTree:
         Get dictionary of all colors in the lattice and a list of their corresponding
         Voxel IDs which contain that color (both color / complement).
         """
-        colordict = {}
-        for voxel in self.voxels:
-            for bond in voxel.bonds.values():
-                # Don't initialize colordict if not all bonds are colored
-                if bond.color is None:
-                    raise ValueError(f"Missing colors: Uncolored bond {bond.get_label} on voxel{voxel.id}")
-                # Add the bond color to the dictionary
-                color = abs(bond.color)
-                if color not in colordict:
-                    # print(f"Creating new color entry: {color}, voxel{voxel.id}")
-                    colordict[color] = [voxel.id]
-                elif voxel.id not in colordict[color]:
-                    colordict[color].append(voxel.id)
-                    # print(f"Adding voxel{voxel.id} to color {color}")
-
-        # Sort the dictionary keys by ascending color
-        colordict = {key: colordict[key] for key in sorted(colordict)}
+        bond_colors = self.init_bond_colors()
+
+        # Bucket the (voxel_id, abs(color)) pairs of every bond by color at once.
+        # A stable sort keeps voxel ids in lattice order within each color
+        abs_colors = np.abs(bond_colors).ravel()
+        voxel_ids = np.repeat(np.arange(len(bond_colors)), bond_colors.shape[1])
+        order = np.argsort(abs_colors, kind='stable')
+        colors, starts = np.unique(abs_colors[order], return_index=True)
+        color_voxel_ids = np.split(voxel_ids[order], starts[1:])
+
+        colordict = {
+            int(color): list(dict.fromkeys(ids.tolist()))   # Drop repeats, keep order
+            for color, ids in zip(colors, color_voxel_ids)
+        }   # np.unique already yields colors in ascending order
+
         self.colordict = colordict
+        self._color_components = {}     # Colors may have moved between bonds
                     
         return colordict
     
+    def init_bond_colors(self) -> np.ndarray:
+        """
+        The lattice's (N, 6) bond color array (one row per voxel, kept in sync
+        by Bond.set_color). Raises if any bond is still uncolored.
+        """
+        uncolored_voxels = np.flatnonzero((self.bond_colors == 0).any(axis=1))
+        # Don't initialize colordict if not all bonds are colored
+        if uncolored_voxels.size:
+            raise ValueError(f"Missing colors: Uncolored bond on voxel{uncolored_voxels[0]}")
+
+        return self.bond_colors
+    
     def init_all_color_configs(self) -> None:
         """
         Initialize all possible color configurations for all colors in the lattice.
@@ -183,65 +366,102 @@ class LatticeColorTree:
 
         return all_color_configs
     
-    def color_configs(self, color: int) -> list[dict[int, int]]:
+    def color_configs(self, color: int) -> list[int]:
         """
         Get a list of all complementarity configurations of a given color 
-        in the lattice. Each configuration is a dictionary {voxel_id: complementarity}, where
-        complementarity is either +1 or -1 and is multiplied to abs(color) to get the bond color
-        of those bonds on the voxel.
+        in the lattice. Each configuration is a bitmask over colordict[color] (bit i 
+        set = i-th voxel_id flipped) wrt. self.default_color_config[color], a dictionary
+        {voxel_id: complementarity}, where complementarity is either +1 or -1 and is 
+        multiplied to abs(color) to get the bond color of those bonds on the voxel.
+        Use materialize_color_config to get the full dictionary of a configuration.
         """
         if self.colordict is None:
             raise ValueError("Color dictionary not initialized yet. Run Lattice.init_colordict() first.")
         
-        color_configs = []
-        seen_configs = set()
-
-        # Default configuration
-        default_color_config = {}
-        for voxel_id in self.colordict[color]:
-            voxel = self.get_voxel(voxel_id)
-            complementarity = voxel.get_complementarity(color)
-            default_color_config[voxel_id] = complementarity
-
-        self.default_color_config[color] = default_color_config
-
-        # Add default configuration to the list and set
-        color_configs.append(default_color_config)
-        seen_configs.add(tuple(sorted(default_color_config.items())))
-
         # Get all voxel_ids that contain the color
         voxel_ids = list(self.colordict[color])
 
-        # Iterate over all possible numbers of voxels to flip (1 to len(voxel_ids))
-        for r in range(1, len(voxel_ids) + 1):
-            # Generate all r-combinations of voxel_ids
-            for permutation in itertools.combinations(voxel_ids, r):
-                # Create a new color configuration after flipping
-                flipped_voxels = {}
-                for voxel_id in permutation:
-                    voxel = self.get_voxel(voxel_id)
-                    flipped_voxels.update(voxel.flip_complementarity(color))
+        # Default configuration: the sign of the color's bonds on each voxel
+        rows = self.bond_colors[voxel_ids]
+        color_columns = (np.abs(rows) == color).argmax(axis=1)
+        complementarities = np.sign(rows[np.arange(len(voxel_ids)), color_columns])
+        self.default_color_config[color] = dict(zip(voxel_ids, complementarities.tolist()))
+
+        # Flipping one voxel flips every voxel connected to it through bonds of
+        # this color, so the distinct configurations are exactly the subsets of
+        # these connected components (2^components instead of 2^voxels)
+        voxel_bits = {voxel_id: 1 << bit for bit, voxel_id in enumerate(voxel_ids)}
+        component_masks = [
+            sum(voxel_bits[voxel_id] for voxel_id in component)
+            for component in self.color_components(color)
+        ]
+
+        # Config of each subset of components (bit j of subset = flip component j),
+        # built from the subset without its lowest component. Configs are distinct
+        # by construction, subset 0 being the default configuration
+        color_configs = [0] * (1 << len(component_masks))
+        for subset in range(1, len(color_configs)):
+            lowest_bit = subset & -subset
+            color_configs[subset] = color_configs[subset ^ lowest_bit] | component_masks[lowest_bit.bit_length() - 1]
 
-                # Merge flipped configuration with default configuration
-                new_color_config = default_color_config.copy()
-                new_color_config.update(flipped_voxels)
+        return color_configs
 
-                # Convert the configuration to a hashable format (tuple of sorted pairs)
-                new_config_tuple = tuple(sorted(new_color_config.items()))
+    def materialize_color_config(self, color: int, config, default_config: dict[int, int] = None) -> dict[int, int]:
+        """
+        Full {voxel_id: complementarity} dictionary of a configuration given as the
+        bitmask of voxel_ids flipped from the default (full dictionaries are returned as is).
+        default_config is the default the bitmask was built against (the current
+        self.default_color_config[color] if not supplied).
+        """
+        if isinstance(config, dict):
+            return config
+        if default_config is None:
+            default_config = self.default_color_config[color]
+        return {
+            voxel_id: -complementarity if config >> bit & 1 else complementarity
+            for bit, (voxel_id, complementarity) in enumerate(default_config.items())
+        }
+
+    def color_components(self, color: int) -> list[list[int]]:
+        """
+        Voxel ids of each group of voxels connected through bonds of the given color.
+        Only depends on which bonds carry the color (not their complementarity), so
+        it is computed once per color and reused until init_colordict is rerun.
+        """
+        if self._color_components is None:
+            raise ValueError("Color dictionary not initialized yet. Run Lattice.init_colordict() first.")
 
-                # Check if this configuration is unique
-                if new_config_tuple not in seen_configs:
-                    color_configs.append(new_color_config)
-                    seen_configs.add(new_config_tuple)
+        if color not in self._color_components:
+            components = []
+            seen_voxels = set()
+            for voxel_id in self.colordict[color]:
+                if voxel_id in seen_voxels:
+                    continue
+                component = list(self.get_voxel(voxel_id).flip_complementarity(color))
+                components.append(component)
+                seen_voxels.update(component)
+            self._color_components[color] = components
 
-        return color_configs
+        return self._color_components[color]
 
-    
     def apply_color_configs(self, color_configs: dict[int, dict[int, int]]) -> None:
         for color, config in color_configs.items():
-            for voxel_id, complementarity in config.items():
-                voxel = self.get_voxel(voxel_id)
-                voxel.repaint_complement(color, complementarity)
+            self.apply_color_config(color, config)
+
+    def apply_color_config(self, color: int, config) -> None:
+        """
+        Apply a single color's configuration, either as a full dictionary
+        {voxel_id: complementarity} or as the bitmask of voxel_ids flipped from the default.
+        """
+        for voxel_id, complementarity in self.materialize_color_config(color, config).items():
+            voxel = self.get_voxel(voxel_id)
+            voxel.repaint_complement(color, complementarity)
+
+    def color_state(self) -> bytes:
+        """
+        Hashable snapshot of every bond color in the lattice (in voxel order).
+        """
+        return self.bond_colors.tobytes()
 
     def reset_color_config(self) -> None:
         """